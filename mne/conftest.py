@@ -27,6 +27,7 @@ except Exception:
 import numpy as np
 import mne
 from mne.datasets import testing
+from mne.fixes import has_numba
 
 test_path = testing.data_path(download=False)
 s_path = op.join(test_path, 'MEG', 'sample')
@@ -169,6 +170,25 @@ def check_gui_ci():
         pytest.skip('Skipping GUI tests on Travis OSX and Azure Windows')
 
 
+@pytest.fixture(scope='function', params=('Numba', 'NumPy'))
+def numba_conditional(monkeypatch, request):
+    """Test both code paths on machines that have Numba."""
+    assert request.param in ('Numba', 'NumPy')
+    if request.param == 'NumPy' and has_numba:
+        from mne.stats import cluster_level
+        from mne import filter as mne_filter
+        monkeypatch.setattr(
+            cluster_level, '_get_buddies', cluster_level._get_buddies_fallback)
+        monkeypatch.setattr(
+            cluster_level, '_get_selves', cluster_level._get_selves_fallback)
+        monkeypatch.setattr(
+            cluster_level, '_where_first', cluster_level._where_first_fallback)
+        monkeypatch.setattr(mne_filter, 'has_numba', False)
+    if request.param == 'Numba' and not has_numba:
+        pytest.skip('Numba not installed')
+    yield request.param
+
+
 @pytest.fixture(scope='session', params=[testing._pytest_param()])
 def _evoked():
     # This one is session scoped, so be sure not to modify it (use evoked
@@ -1,7 +1,8 @@
 """IIR and FIR filtering and resampling functions."""
 
 from copy import deepcopy
-from functools import partial
+from functools import partial, lru_cache
+import warnings
 
 import numpy as np
 
@@ -9,7 +10,7 @@ from .annotations import _annotations_starts_stops
 from .io.pick import _picks_to_idx
 from .cuda import (_setup_cuda_fft_multiply_repeated, _fft_multiply_repeated,
                    _setup_cuda_fft_resample, _fft_resample, _smart_pad)
-from .fixes import irfft, ifftshift, fftfreq
+from .fixes import irfft, ifftshift, fftfreq, jit, has_numba, prange
 from .parallel import parallel_func, check_n_jobs
 from .time_frequency.multitaper import _mt_spectra, _compute_mt_params
 from .utils import (logger, verbose, sum_squared, check_version, warn, _pl,
@@ -420,6 +421,112 @@ def _check_coefficients(system):
                            'coefficients.')
 
 
+@jit()
+def _lfilter_df2t_step(xt, b, a, z):  # pragma: no cover
+    """Advance a direct-form II transposed filter (state z) by one sample."""
+    n_z = len(z)
+    if n_z == 0:
+        return b[0] * xt
+    yt = b[0] * xt + z[0]
+    for k in range(n_z - 1):
+        z[k] = b[k + 1] * xt + z[k + 1] - a[k + 1] * yt
+    z[n_z - 1] = b[n_z] * xt - a[n_z] * yt
+    return yt
+
+
+@jit(parallel=True)
+def _filtfilt_ba_kernel(b, a, x, picks, zi, padlen):  # pragma: no cover
+    # Rows are independent, so parallelize across them. The odd extension
+    # is read on the fly rather than materialized, the forward pass goes
+    # to a per-row buffer, and the backward pass writes its center
+    # directly back to x (the leading pad is just discarded, so the
+    # backward pass can stop early).
+    n_times = x.shape[1]
+    n_ext = n_times + 2 * padlen
+    for pi in prange(len(picks)):
+        row = x[picks[pi]]
+        y = np.empty(n_ext)
+        x_first = 2 * row[0]
+        x_last = 2 * row[n_times - 1]
+        if padlen > 0:
+            z = zi * (x_first - row[padlen])
+        else:
+            z = zi * row[0]
+        for t in range(padlen):
+            y[t] = _lfilter_df2t_step(x_first - row[padlen - t], b, a, z)
+        for t in range(n_times):
+            y[padlen + t] = _lfilter_df2t_step(row[t], b, a, z)
+        for t in range(padlen):
+            y[padlen + n_times + t] = _lfilter_df2t_step(
+                x_last - row[n_times - 2 - t], b, a, z)
+        z = zi * y[n_ext - 1]
+        for t in range(n_ext - 1, padlen + n_times - 1, -1):
+            _lfilter_df2t_step(y[t], b, a, z)
+        for t in range(n_times - 1, -1, -1):
+            row[t] = _lfilter_df2t_step(y[padlen + t], b, a, z)
+
+
+@lru_cache(maxsize=32)
+def _filtfilt_setup(b, a):
+    """Normalize (b, a) and get SOS or the steady-state initial conditions.
+
+    If the recursive part is above second order, the system is converted to
+    second-order sections (which are numerically better behaved than the
+    direct form) as long as the conversion reproduces the frequency
+    response. FIR-like systems (``a[1:] == 0``) are never converted, as
+    finding the roots of a long ``b`` is inaccurate. Otherwise ``sos`` is
+    None and ``zi`` holds the ``lfilter_zi`` initial conditions, which are
+    only used by our compiled kernel (:func:`scipy.signal.filtfilt`
+    computes its own when Numba is not available).
+
+    The same coefficients are typically used for many calls (e.g., once
+    per epoch or per redraw when browsing), so this is cached, keyed on the
+    coefficient tuples. The returned arrays must not be modified.
+    """
+    from scipy.signal import lfilter_zi, tf2sos, freqz, sosfreqz
+    b, a = np.array(b, float), np.array(a, float)
+    b, a = b / a[0], a / a[0]
+    sos = zi = None
+    nonzero = np.flatnonzero(a[1:])
+    order = nonzero[-1] + 1 if len(nonzero) else 0
+    if order > 2:
+        with warnings.catch_warnings(record=True):  # BadCoefficients
+            warnings.simplefilter('ignore')
+            sos = tf2sos(b, a)
+        # root finding can fail, so make sure the response is preserved
+        h_ba = freqz(b, a, worN=1024)[1]
+        h_sos = sosfreqz(sos, worN=1024)[1]
+        if not (np.isfinite(h_sos).all() and np.allclose(
+                h_sos, h_ba, rtol=0, atol=1e-6 * np.abs(h_ba).max())):
+            sos = None
+    n = max(len(a), len(b))
+    b = np.concatenate([b, np.zeros(n - len(b))])
+    a = np.concatenate([a, np.zeros(n - len(a))])
+    if sos is None:
+        zi = lfilter_zi(b, a) if n > 1 else np.zeros(0)
+    return b, a, zi, sos
+
+
+def _filtfilt_ba(x, b, a, zi, picks, padlen, n_jobs):
+    """Apply a (b, a) filter forward-backward like scipy.signal.filtfilt.
+
+    This uses odd padding and steady-state initial conditions just like
+    :func:`scipy.signal.filtfilt`, but runs both passes in a single
+    compiled kernel (in parallel across ``picks`` using up to ``n_jobs``
+    threads), operating in place on the rows of the 2D array ``x``.
+    ``b``, ``a``, and ``zi`` should come from :func:`_filtfilt_setup`.
+    """
+    import numba
+    picks = np.asarray(picks, np.int64)
+    # respect n_jobs rather than using every Numba thread
+    n_threads = numba.get_num_threads()
+    numba.set_num_threads(min(n_jobs, numba.config.NUMBA_NUM_THREADS))
+    try:
+        _filtfilt_ba_kernel(b, a, x, picks, zi, padlen)
+    finally:
+        numba.set_num_threads(n_threads)
+
+
 def _filtfilt(x, iir_params, picks, n_jobs, copy):
     """Call filtfilt."""
     # set up array for filtering, reshape to 2D, operate on last axis
@@ -428,14 +535,27 @@ def _filtfilt(x, iir_params, picks, n_jobs, copy):
     n_jobs = check_n_jobs(n_jobs)
     x, orig_shape, picks = _prep_for_filtering(x, copy, picks)
     if 'sos' in iir_params:
-        fun = partial(sosfiltfilt, sos=iir_params['sos'], padlen=padlen,
-                      axis=-1)
-        _check_coefficients(iir_params['sos'])
+        sos = iir_params['sos']
+        _check_coefficients(sos)
     else:
-        fun = partial(filtfilt, b=iir_params['b'], a=iir_params['a'],
-                      padlen=padlen, axis=-1)
-        _check_coefficients((iir_params['b'], iir_params['a']))
-    if n_jobs == 1:
+        b, a = iir_params['b'], iir_params['a']
+        _check_coefficients((b, a))
+        # high-order systems get turned into SOS by this (cached) function
+        b, a, zi, sos = _filtfilt_setup(tuple(np.atleast_1d(b).tolist()),
+                                        tuple(np.atleast_1d(a).tolist()))
+    if sos is not None:
+        fun = partial(sosfiltfilt, sos=sos, padlen=padlen, axis=-1)
+    else:
+        fun = partial(filtfilt, b=b, a=a, padlen=padlen, axis=-1)
+    use_kernel = sos is None and has_numba
+    if use_kernel:
+        import numba
+        # limiting the kernel to n_jobs threads needs Numba 0.49+
+        use_kernel = hasattr(numba, 'set_num_threads')
+    if use_kernel:
+        # Numba threads over the picks itself (no GIL), so skip joblib
+        _filtfilt_ba(x, b, a, zi, picks, padlen, n_jobs)
+    elif n_jobs == 1:
         for p in picks:
             x[p] = fun(x=x[p])
     else:
@@ -1,20 +1,23 @@
 import os.path as op
+import warnings
 
 import numpy as np
 from numpy.testing import (assert_array_almost_equal, assert_almost_equal,
                            assert_array_equal, assert_allclose,
                            assert_array_less)
 import pytest
-from scipy.signal import resample as sp_resample, butter, freqz, sosfreqz
+from scipy.signal import (resample as sp_resample, butter, freqz, sosfreqz,
+                          filtfilt, firwin, cheby1)
 
 from mne import create_info
-from mne.fixes import fft, fftfreq
+from mne import filter as mne_filter
+from mne.fixes import fft, fftfreq, has_numba
 from mne.io import RawArray, read_raw_fif
 from mne.io.pick import _DATA_CH_TYPES_SPLIT
 from mne.filter import (filter_data, resample, _resample_stim_channels,
                         construct_iir_filter, notch_filter, detrend,
                         _overlap_add_filter, _smart_pad, design_mne_c_filter,
-                        estimate_ringing_samples, create_filter)
+                        estimate_ringing_samples, create_filter, _filtfilt)
 
 from mne.utils import (sum_squared, run_tests_if_main,
                        catch_logging, requires_mne, run_subprocess)
@@ -197,6 +200,106 @@ def test_iir_stability():
     assert_allclose(x_sos[100:-100], x_ba[100:-100])
 
 
+@pytest.mark.parametrize('ba', [
+    butter(1, 0.1),
+    butter(2, 0.1),
+    (np.convolve(butter(2, 0.1)[0], [1., 0.5, 0.25]),  # len(b) == 5
+     butter(2, 0.1)[1]),
+    (np.array([0.1, 0.2, 0.1]) * 2., np.array([1., -0.6, 0.2]) * 2.),
+    (np.array([0.3, 0.1]), np.array([2., -0.8, 0.3])),  # a[0] != 1
+    (np.array([0.2, 0.5, 0.2, 0.1]), np.array([1.5, -0.5])),
+])
+@pytest.mark.parametrize('padlen', (0, 1, 50, 1000))
+@pytest.mark.parametrize('n_jobs', (1, 2))
+def test_filtfilt_ba(ba, padlen, n_jobs, numba_conditional, monkeypatch):
+    """Test our forward-backward (b, a) filtering against SciPy."""
+    rng = np.random.RandomState(0)
+    x = rng.randn(3, 1000)
+    b, a = ba
+    iir_params = dict(b=b, a=a, padlen=padlen)
+    x_want = filtfilt(b, a, x, padlen=min(padlen, x.shape[-1] - 1))
+    mne_filter._filtfilt_setup.cache_clear()
+    used_threads = list()
+    if numba_conditional == 'Numba':
+        import numba
+        n_threads = numba.get_num_threads()
+        kernel = mne_filter._filtfilt_ba_kernel
+
+        def _kernel(*args):
+            used_threads.append(numba.get_num_threads())
+            kernel(*args)
+
+        monkeypatch.setattr(mne_filter, '_filtfilt_ba_kernel', _kernel)
+    for _ in range(2):
+        x_filt = _filtfilt(x, iir_params, [0, 2], n_jobs, True)
+        assert_allclose(x_filt[[0, 2]], x_want[[0, 2]], atol=1e-12)
+        assert_array_equal(x_filt[1], x[1])
+    # the filter setup is only done once, and stays in the direct form
+    info = mne_filter._filtfilt_setup.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert mne_filter._filtfilt_setup(tuple(b), tuple(a))[3] is None
+    if numba_conditional == 'Numba':
+        # limited to n_jobs during the call, restored afterward
+        want = min(n_jobs, numba.config.NUMBA_NUM_THREADS)
+        assert used_threads == [want, want]
+        assert numba.get_num_threads() == n_threads
+    else:
+        assert used_threads == []
+
+
+@pytest.mark.parametrize('n_jobs', (1, 2))
+def test_filtfilt_ba_old_numba(n_jobs, monkeypatch):
+    """Test that Numba without thread control falls back to SciPy."""
+    numba = pytest.importorskip('numba')
+    if not has_numba:
+        pytest.skip('Numba not installed')
+    # Numba < 0.49 has no get_num_threads / set_num_threads
+    monkeypatch.delattr(numba, 'get_num_threads')
+    monkeypatch.delattr(numba, 'set_num_threads')
+
+    def _kernel(*args):
+        raise AssertionError('compiled kernel should not be used')
+
+    monkeypatch.setattr(mne_filter, '_filtfilt_ba_kernel', _kernel)
+    rng = np.random.RandomState(0)
+    x = rng.randn(3, 1000)
+    b, a = butter(2, 0.1)
+    x_filt = _filtfilt(x, dict(b=b, a=a, padlen=50), None, n_jobs, True)
+    assert_allclose(x_filt, filtfilt(b, a, x, padlen=50), atol=1e-12)
+
+
+@pytest.mark.parametrize('ba, want_sos', [
+    (butter(4, 0.1), True),
+    (butter(8, 0.05), True),
+    (cheby1(3, 1, [0.1, 0.2], 'bandpass'), True),
+    ((np.ones(10), [1, 0]), False),  # documented FIR-like example
+    ((firwin(31, 0.2), [1.]), False),
+    ((firwin(301, 0.2), [1.]), False),  # tf2sos would be way off
+    ((firwin(301, 0.2), [1., 0., 0., 0.]), False),
+    ((firwin(101, 0.2), [1., -0.5, 0.2, 0.1]), False),  # bad conversion
+])
+def test_filtfilt_ba_high_order(ba, want_sos, numba_conditional):
+    """Test that high-order (b, a) systems are filtered accurately."""
+    rng = np.random.RandomState(0)
+    x = rng.randn(2, 2000)
+    b, a = ba
+    iir_params = dict(b=b, a=a, padlen=900)
+    mne_filter._filtfilt_setup.cache_clear()
+    # the stability check (tf2zpk) can complain about long b
+    with warnings.catch_warnings(record=True):
+        warnings.simplefilter('ignore')
+        x_filt = _filtfilt(x, iir_params, None, 1, True)
+    x_want = filtfilt(b, a, x, padlen=900)
+    # SOS is more accurate than the direct form here, so allow some slop
+    assert_allclose(x_filt, x_want, rtol=0,
+                    atol=1e-6 * np.abs(x_want).max())
+    sos = mne_filter._filtfilt_setup(tuple(np.atleast_1d(b).tolist()),
+                                     tuple(np.atleast_1d(a).tolist()))[3]
+    assert (sos is not None) == want_sos
+    info = mne_filter._filtfilt_setup.cache_info()
+    assert (info.hits, info.misses) == (1, 1)  # conversion is cached
+
+
 def test_notch_filters():
     """Test notch filters."""
     # let's use an ugly, prime sfreq for fun